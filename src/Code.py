@@ -5,10 +5,11 @@ import os
 import bpy
 import multiprocessing
 
-from collections import deque
 from queue import Queue
 
 import time
+import tempfile
+import threading
 from multiprocessing import Pool, cpu_count
 
 # ----------------------------
@@ -16,10 +17,596 @@ from multiprocessing import Pool, cpu_count
 # ----------------------------
 import numpy as np
 
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is not bundled with Blender; text grids are then parsed with np.loadtxt
+    pd = None
+
+try:
+    from scipy import ndimage
+except ImportError:
+    # SciPy is not bundled with Blender; connectivity analysis falls back to the Numba kernels
+    ndimage = None
+
+# The Numba kernels are compiled with nogil=True: compiled code then runs without the GIL, so a
+# kernel running on the modal operators' worker thread does not stall Blender's Python UI thread.
+# Parallel kernels must still not run concurrently (Numba's workqueue threading layer aborts the
+# process on concurrent use), so every launch goes through _PARALLEL_KERNEL_LOCK below.
+try:
+    from numba import njit, prange, get_num_threads
+    HAS_NUMBA = True
+except ImportError:
+    # Without Numba the kernels below run as plain Python
+    HAS_NUMBA = False
+    prange = range
+
+    def get_num_threads():
+        return 1
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ----------------------------
 #  Project-Specific Imports
 # ----------------------------
 
+# ----------------------------
+#  Module-Level Constants
+# ----------------------------
+# Neighbor offsets shared by the connectivity operators, as (K, 3) int32 arrays
+NEIGHBORS_6 = np.array([(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)], dtype=np.int32)
+NEIGHBORS_18 = np.array([(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
+                         if (x, y, z) != (0, 0, 0) and abs(x) + abs(y) + abs(z) <= 2], dtype=np.int32)
+NEIGHBORS_26 = np.array([(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
+                         if (x, y, z) != (0, 0, 0)], dtype=np.int32)
+
+# Causal halves of the neighbor tables: the offsets that come before a voxel in raster order.
+# A union-find scan that links each voxel to these only merges every adjacent pair once.
+CAUSAL_NEIGHBORS_6 = NEIGHBORS_6[NEIGHBORS_6 @ np.array([9, 3, 1], dtype=np.int32) < 0]
+CAUSAL_NEIGHBORS_18 = NEIGHBORS_18[NEIGHBORS_18 @ np.array([9, 3, 1], dtype=np.int32) < 0]
+CAUSAL_NEIGHBORS_26 = NEIGHBORS_26[NEIGHBORS_26 @ np.array([9, 3, 1], dtype=np.int32) < 0]
+
+# Connectivity (6, 18 or 26) -> neighbor table, causal neighbor table and ndimage structuring element
+NEIGHBOR_ARRAYS = {6: NEIGHBORS_6, 18: NEIGHBORS_18, 26: NEIGHBORS_26}
+CAUSAL_NEIGHBOR_ARRAYS = {6: CAUSAL_NEIGHBORS_6, 18: CAUSAL_NEIGHBORS_18, 26: CAUSAL_NEIGHBORS_26}
+
+# 3x3x3 structuring elements for ndimage.label (face, face+edge, face+edge+vertex),
+# equivalent to ndimage.generate_binary_structure(3, 1 | 2 | 3)
+STRUCT_6 = np.abs(np.indices((3, 3, 3)) - 1).sum(axis=0) <= 1
+STRUCT_18 = np.abs(np.indices((3, 3, 3)) - 1).sum(axis=0) <= 2
+STRUCT_26 = np.abs(np.indices((3, 3, 3)) - 1).sum(axis=0) <= 3
+STRUCTURES = {6: STRUCT_6, 18: STRUCT_18, 26: STRUCT_26}
+
+# Parsed voxel grids keyed by file path, stored as ((mtime, shape), data)
+_VOXEL_CACHE = {}
+
+# Bubble counts keyed by file path, stored as ((mtime, shape), {connectivity: count})
+_BUBBLE_CACHE = {}
+
+# Volume-sized work arrays reused between analysis runs, keyed by name (see _scratch_buffer)
+_SCRATCH_BUFFERS = {}
+
+# Serializes the parallel Numba kernels: with the GIL released, the mesh worker thread and the
+# main thread could otherwise launch them at the same time
+_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+# True while a mesh worker started by BaseProcessVoxelDataOperator.invoke is in flight; both
+# process operators are disabled (see poll) until its modal handler finishes or is cancelled
+_PROCESS_JOB_RUNNING = False
+
+# Corner offsets of the 6 cube faces, one row per face direction (-x, +x, -y, +y, -z, +z).
+# Corners are listed counterclockwise when viewed from outside, so every quad faces outward.
+FACE_CORNERS = np.array([
+    [(0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 0)],  # -x
+    [(1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)],  # +x
+    [(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)],  # -y
+    [(0, 1, 0), (0, 1, 1), (1, 1, 1), (1, 1, 0)],  # +y
+    [(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)],  # -z
+    [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)],  # +z
+], dtype=np.int32)
+
+def _load_voxels(filepath, shape):
+    """
+    Load a voxel grid from a .npy file or a comma-separated text file.
+
+    Text files are converted to a "<file>.npy" sidecar on first load, so later loads (also in
+    new Blender sessions) memory-map the binary copy instead of parsing the text again.
+
+    Parameters:
+        filepath (str): Path to the voxel data file
+        shape (tuple): Grid dimensions (depth, height, width)
+
+    Returns:
+        np.ndarray: 3D voxel array of the given shape
+    """
+    if filepath.endswith('.npy'):
+        # Memory-map the binary file and use it directly: every consumer only reads the grid,
+        # so pages are read on first touch and no second full-volume copy is made
+        data = np.load(filepath, mmap_mode='r')
+        if data.dtype != np.uint8:
+            # Grids saved as float64/int64 (or bool) are narrowed once to the 1-byte type every
+            # consumer expects, instead of streaming 8 bytes per voxel through each analysis
+            data = data.astype(np.uint8)
+        return data.reshape(shape)
+
+    # Text grids are parsed once and saved as a .npy sidecar next to the source file;
+    # later loads memory-map the sidecar while it is newer than the text file
+    sidecar_path = filepath + '.npy'
+    if os.path.exists(sidecar_path) and os.path.getmtime(sidecar_path) >= os.path.getmtime(filepath):
+        data = np.load(sidecar_path, mmap_mode='r')
+        if data.size == np.prod(shape):
+            return data.reshape(shape)
+
+    if pd is not None:
+        # pandas' C tokenizer parses large CSV files far faster than np.loadtxt
+        data = pd.read_csv(filepath, header=None, dtype=np.uint8, engine='c').to_numpy()
+    else:
+        # Parsing straight to uint8 keeps the raw array 8x smaller than the float64 default
+        data = np.loadtxt(filepath, delimiter=',', dtype=np.uint8)
+    data = data.reshape(shape)
+
+    try:
+        # Write to a temporary file in the same directory and rename it over the sidecar, so a
+        # concurrent load (or a memmap of the previous sidecar) never sees a half-written file
+        fd, tmp_path = tempfile.mkstemp(suffix='.npy', dir=os.path.dirname(sidecar_path) or '.')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                np.save(tmp_file, data)
+            os.replace(tmp_path, sidecar_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        # Read-only location: keep the parsed array, it just won't be reused across sessions
+        return data
+    return np.load(sidecar_path, mmap_mode='r')
+
+def _load_voxels_cached(filepath, shape):
+    """
+    Return the voxel grid for filepath, reusing the last parsed array while the file is unchanged.
+
+    Parameters:
+        filepath (str): Path to the voxel data file
+        shape (tuple): Grid dimensions (depth, height, width)
+
+    Returns:
+        np.ndarray: 3D voxel array of the given shape (shared; do not modify in place)
+    """
+    stamp = (os.path.getmtime(filepath), tuple(shape))
+    cached = _VOXEL_CACHE.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # Cache miss or the file changed on disk: parse it and replace the previous entry
+    data = _load_voxels(filepath, shape)
+    _VOXEL_CACHE[filepath] = (stamp, data)
+    return data
+
+@njit(parallel=True, cache=True, nogil=True)
+def _compute_exposed(data, out_negx, out_posx, out_negy, out_posy, out_negz, out_posz):
+    """
+    Fill the six exposed-face masks of the occupied voxels in a single pass over data.
+
+    A face is exposed when the voxel is occupied (1) and its neighbor in that direction is
+    outside the grid or not occupied. The output arrays must be preallocated and zeroed.
+    """
+    shape_x, shape_y, shape_z = data.shape
+    for i in prange(shape_x):
+        for j in range(shape_y):
+            for k in range(shape_z):
+                if data[i, j, k] == 1:
+                    out_negx[i, j, k] = i == 0 or data[i - 1, j, k] != 1
+                    out_posx[i, j, k] = i == shape_x - 1 or data[i + 1, j, k] != 1
+                    out_negy[i, j, k] = j == 0 or data[i, j - 1, k] != 1
+                    out_posy[i, j, k] = j == shape_y - 1 or data[i, j + 1, k] != 1
+                    out_negz[i, j, k] = k == 0 or data[i, j, k - 1] != 1
+                    out_posz[i, j, k] = k == shape_z - 1 or data[i, j, k + 1] != 1
+
+def _exposed_face_masks(data):
+    """
+    Compute which faces of the occupied voxels border empty space.
+
+    Parameters:
+        data (np.ndarray): 3D voxel array (1 = occupied)
+
+    Returns:
+        list: Six boolean masks shaped like data, in the same order as FACE_CORNERS
+    """
+    if HAS_NUMBA:
+        # Fused kernel: no padded copy or per-direction temporaries, only the six outputs
+        masks = [np.zeros(data.shape, dtype=bool) for _ in range(6)]
+        with _PARALLEL_KERNEL_LOCK:
+            _compute_exposed(data, *masks)
+        return masks
+
+    # Vectorized fallback: compare against a zero-padded occupancy grid
+    occupied = data == 1
+    padded_data = np.zeros((occupied.shape[0] + 2, occupied.shape[1] + 2, occupied.shape[2] + 2), dtype=bool)
+    padded_data[1:-1, 1:-1, 1:-1] = occupied
+    neighbors = (
+        padded_data[:-2, 1:-1, 1:-1], padded_data[2:, 1:-1, 1:-1],  # -x and +x neighbors
+        padded_data[1:-1, :-2, 1:-1], padded_data[1:-1, 2:, 1:-1],  # -y and +y neighbors
+        padded_data[1:-1, 1:-1, :-2], padded_data[1:-1, 1:-1, 2:],  # -z and +z neighbors
+    )
+    return [occupied & ~neighbor for neighbor in neighbors]
+
+def _index_quad_corners(xs, ys, zs):
+    """
+    Merge duplicate quad corners into a shared vertex list.
+
+    Parameters:
+        xs, ys, zs (np.ndarray): int32 corner coordinates, 4 consecutive entries per quad
+
+    Returns:
+        tuple: (vertices, faces) as an (N, 3) int32 array and an (F, 4) int32 array of vertex indices
+    """
+    # Pack each corner into one int64 key (21 bits per axis) so deduplication is a 1-D unique;
+    # the inverse indices are the quads' vertex indices
+    keys = (xs.astype(np.int64) << 42) | (ys.astype(np.int64) << 21) | zs.astype(np.int64)
+    _, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    vertices = np.column_stack((xs[first_index], ys[first_index], zs[first_index]))
+    # Coordinates stay integer voxel indices; _create_quad_mesh casts them to float32 once at upload.
+    # np.unique returns intp indices, narrowed here to the int32 Blender stores them as.
+    return vertices, inverse.reshape(-1, 4).astype(np.int32)
+
+def _remove_generated_objects():
+    """
+    Remove the mesh and camera objects left by a previous run through the data API.
+
+    Unlike bpy.ops.object.delete this does not touch the selection, the undo stack or
+    unrelated objects. The orphaned mesh, camera and material datablocks are freed too.
+    """
+    for obj in list(bpy.data.objects):
+        if not (obj.name.startswith("PerimeterCubes") or obj.name.startswith("Camera")):
+            continue
+        # Read everything needed before removal; the object reference is invalid afterwards
+        obj_type = obj.type
+        obj_data = obj.data
+        materials = list(obj_data.materials) if obj_type == 'MESH' else []
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+        # Free datablocks that nothing else uses anymore
+        if obj_data is not None and obj_data.users == 0:
+            if obj_type == 'MESH':
+                bpy.data.meshes.remove(obj_data)
+            elif obj_type == 'CAMERA':
+                bpy.data.cameras.remove(obj_data)
+        for material in materials:
+            if material is not None and material.users == 0:
+                bpy.data.materials.remove(material)
+
+def _create_quad_mesh(name, vertices, faces):
+    """
+    Create a Blender mesh made of quads by bulk-copying NumPy buffers with foreach_set.
+
+    Parameters:
+        name (str): Name of the new mesh datablock
+        vertices (array-like): (N, 3) vertex coordinates
+        faces (array-like): (F, 4) vertex indices of each quad
+
+    Returns:
+        bpy.types.Mesh: The new mesh
+    """
+    verts_flat = np.asarray(vertices, dtype=np.float32).ravel()
+    faces_flat = np.asarray(faces, dtype=np.int32).ravel()
+    n_faces = faces_flat.size // 4
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(verts_flat.size // 3)
+    mesh.vertices.foreach_set("co", verts_flat)
+    mesh.loops.add(faces_flat.size)
+    mesh.loops.foreach_set("vertex_index", faces_flat)
+    mesh.polygons.add(n_faces)
+    # Every polygon is a quad; loop_total is derived from the starts (read-only since Blender 4.0)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, faces_flat.size, 4, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    return mesh
+
+def _scratch_buffer(name, shape, dtype):
+    """
+    Return a reusable work array, allocating it only when the requested shape or dtype changes.
+
+    The contents are left over from the previous use; callers must initialize what they read.
+    Reusing the buffers avoids a volume-sized allocation (and its page faults) on every click.
+
+    Parameters:
+        name (str): Key identifying the buffer
+        shape (int or tuple): Required shape
+        dtype (np.dtype): Required element type
+
+    Returns:
+        np.ndarray: Uninitialized C-contiguous array of the given shape and dtype
+    """
+    shape = (shape,) if np.isscalar(shape) else tuple(shape)
+    buffer = _SCRATCH_BUFFERS.get(name)
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        buffer = np.empty(shape, dtype=dtype)
+        _SCRATCH_BUFFERS[name] = buffer
+    return buffer
+
+def _padded_mask(data, value):
+    """
+    Return (data == value) surrounded by a one-voxel False border, built in a scratch buffer.
+
+    Parameters:
+        data (np.ndarray): 3D voxel array
+        value (int): Voxel value selected by the mask (0 = empty, 1 = occupied)
+
+    Returns:
+        np.ndarray: C-contiguous boolean array of shape data.shape + 2 (shared; valid until the next call)
+    """
+    padded = _scratch_buffer('padded_mask', tuple(n + 2 for n in data.shape), np.bool_)
+    padded[0] = padded[-1] = False
+    padded[:, 0] = padded[:, -1] = False
+    padded[:, :, 0] = padded[:, :, -1] = False
+    np.equal(data, value, out=padded[1:-1, 1:-1, 1:-1])
+    return padded
+
+def _flat_offsets(offsets, shape):
+    """
+    Convert (K, 3) neighbor offsets into flat-index offsets for a C-contiguous grid.
+
+    The deltas are returned as a tuple rather than an array: Numba types a tuple with its length,
+    so each causal neighbor table (K = 3, 9 or 13 for 6, 18 or 26-connectivity) gets its own
+    compiled kernel in which the neighbor loop has a compile-time trip count and is unrolled.
+
+    Parameters:
+        offsets (np.ndarray): (K, 3) int32 neighbor offsets
+        shape (tuple): Grid dimensions the flat indices refer to
+
+    Returns:
+        tuple: K int index deltas
+    """
+    strides = np.array([shape[1] * shape[2], shape[2], 1], dtype=np.int64)
+    return tuple(int(delta) for delta in offsets.astype(np.int64) @ strides)
+
+@njit(cache=True, nogil=True)
+def _uf_find(parent, i):
+    """Return the root of i's set, halving the path on the way up."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+@njit(cache=True, nogil=True)
+def _uf_union(parent, rank, a, b):
+    """Merge the sets containing a and b, attaching the shallower tree under the deeper one."""
+    root_a = _uf_find(parent, a)
+    root_b = _uf_find(parent, b)
+    if root_a == root_b:
+        return
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+
+@njit(parallel=True, cache=True, nogil=True)
+def _count_components(mask, causal_flat_offsets, n_slabs, parent, rank, exclude_boundary):
+    """
+    Count the connected components of a 3D boolean mask with a union-find scan.
+
+    The same kernel serves the connected-component count (all components of the occupied
+    voxels) and the bubble count (components of the empty voxels that do not reach the grid
+    boundary).
+
+    Parameters:
+        mask (np.ndarray): C-contiguous 3D boolean array of the voxels to group, padded with a
+            one-voxel False border so neighbor steps need no bounds checks
+        causal_flat_offsets (tuple): Causal neighbor offsets as flat-index deltas for the
+            padded shape (see _flat_offsets)
+        n_slabs (int): Number of x-slabs linked in parallel (usually the Numba thread count)
+        parent (np.ndarray): int32 work array with mask.size + 1 slots (overwritten)
+        rank (np.ndarray): uint8 work array with mask.size + 1 slots (overwritten)
+        exclude_boundary (bool): Skip the components with a voxel on the grid boundary
+
+    Returns:
+        int: Number of (enclosed, if exclude_boundary) components
+    """
+    shape_x, shape_y, shape_z = mask.shape
+    plane = shape_y * shape_z
+    flat_mask = mask.ravel()
+
+    # parent doubles as the voxel state: -1 for voxels outside the mask (and the border),
+    # otherwise the union-find parent. Every later test reads this one array instead of two.
+    for idx in prange(flat_mask.size):
+        parent[idx] = idx if flat_mask[idx] else -1
+        rank[idx] = 0
+
+    # Pass 1: split the real grid into slabs along x and raster-scan each slab on its own thread,
+    # linking every voxel to its already-scanned neighbors in the mask inside the same slab.
+    # Trees never cross slabs here, so the threads write disjoint parts of parent and rank.
+    # Border voxels are never in the mask, so the grid edge needs no separate test.
+    inner_x = shape_x - 2
+    n_slabs = max(1, min(n_slabs, inner_x))
+    for slab in prange(n_slabs):
+        slab_start = (1 + inner_x * slab // n_slabs) * plane
+        slab_stop = (1 + inner_x * (slab + 1) // n_slabs) * plane
+        for idx in range(slab_start, slab_stop):
+            if parent[idx] < 0:
+                continue
+            for offset in causal_flat_offsets:
+                neighbor_idx = idx + offset
+                if neighbor_idx >= slab_start and parent[neighbor_idx] >= 0:
+                    _uf_union(parent, rank, idx, neighbor_idx)
+
+    # Stitch the slabs: only the first layer of each slab has causal neighbors in the previous one
+    for slab in range(1, n_slabs):
+        slab_start = (1 + inner_x * slab // n_slabs) * plane
+        for idx in range(slab_start, slab_start + plane):
+            if parent[idx] < 0:
+                continue
+            for offset in causal_flat_offsets:
+                neighbor_idx = idx + offset
+                if neighbor_idx < slab_start and parent[neighbor_idx] >= 0:
+                    _uf_union(parent, rank, idx, neighbor_idx)
+
+    # Pass 2 (bubbles only): merge every masked voxel in the outer layer of the real grid (just
+    # inside the padding) into one virtual exterior node stored after the last voxel. All
+    # components open to the outside become that single exterior set.
+    # Only the six faces are visited: rows inside an x/y face contribute just their two ends.
+    exterior_root = -1
+    if exclude_boundary:
+        exterior = flat_mask.size
+        parent[exterior] = exterior
+        rank[exterior] = 0
+        z_step = max(1, shape_z - 3)
+        for x in range(1, shape_x - 1):
+            on_x_face = x == 1 or x == shape_x - 2
+            for y in range(1, shape_y - 1):
+                on_face = on_x_face or y == 1 or y == shape_y - 2
+                for z in range(1, shape_z - 1, 1 if on_face else z_step):
+                    idx = x * plane + y * shape_z + z
+                    if parent[idx] >= 0:
+                        _uf_union(parent, rank, exterior, idx)
+        exterior_root = _uf_find(parent, exterior)
+
+    # Pass 3: every root (except the exterior one) is a component; read-only, so it runs in parallel
+    components = 0
+    for idx in prange(flat_mask.size):
+        if parent[idx] == idx and idx != exterior_root:
+            components += 1
+    return components
+
+def _count_enclosed_labels(empty, structure):
+    """
+    Count the components of empty voxels that do not reach the grid boundary, using ndimage.label.
+
+    Parameters:
+        empty (np.ndarray): 3D boolean array, True where the voxel is empty
+        structure (np.ndarray): 3x3x3 structuring element defining connectivity
+
+    Returns:
+        int: Number of enclosed components (bubbles)
+    """
+    # Label the empty space in compiled code, without copying the grid into a padded one,
+    # writing into a reused label buffer
+    labels = _scratch_buffer('labels', empty.shape, np.int32)
+    components = ndimage.label(empty, structure=structure, output=labels)
+    # Components with a voxel on any face of the grid are open to the outside
+    boundary = np.unique(np.concatenate((
+        labels[0].ravel(), labels[-1].ravel(),
+        labels[:, 0].ravel(), labels[:, -1].ravel(),
+        labels[:, :, 0].ravel(), labels[:, :, -1].ravel(),
+    )))
+    # Label 0 is the occupied space, not a component
+    return components - (len(boundary) - int(0 in boundary))
+
+def _count_components_padded(mask, connectivity, exclude_boundary):
+    """
+    Run the Numba union-find count on a padded mask with reused work arrays.
+
+    Parameters:
+        mask (np.ndarray): Padded voxel mask from _padded_mask
+        connectivity (int): Type of voxel connectivity (6, 18, or 26)
+        exclude_boundary (bool): Count only components that do not reach the grid boundary
+
+    Returns:
+        int: Number of components
+    """
+    causal_flat_offsets = _flat_offsets(CAUSAL_NEIGHBOR_ARRAYS[connectivity], mask.shape)
+    with _PARALLEL_KERNEL_LOCK:
+        # One extra slot for the virtual exterior node
+        parent = _scratch_buffer('parent', mask.size + 1, np.int32)
+        rank = _scratch_buffer('rank', mask.size + 1, np.uint8)
+        return _count_components(mask, causal_flat_offsets, get_num_threads(), parent, rank, exclude_boundary)
+
+class VoxelProps(bpy.types.PropertyGroup):
+    """
+    Settings and results of the voxel tools, registered on the scene as a single
+    PointerProperty (context.scene.voxel) instead of one scene property each.
+    """
+
+    # Property to store the file path to the voxel data file
+    voxel_file_path: bpy.props.StringProperty(
+        name="Voxel File Path",
+        description="Path to the voxel data file",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    # Boolean property to indicate if height, width, and depth should be synchronized (same value)
+    synchronize_dimensions: bpy.props.BoolProperty(
+        name="Synchronize Dimensions",
+        description="Use the same value for height, width, and depth",
+        default=False
+    )
+
+    # Float property for uniform size of the voxel grid (applied when synchronization is enabled)
+    voxel_uniform_size: bpy.props.FloatProperty(
+        name="Uniform Size",
+        description="Size for height, width, and depth when synchronized",
+        default=64.0
+    )
+
+    # Individual properties for the depth, height, and width of the voxel grid
+    voxel_depth: bpy.props.FloatProperty(
+        name="Depth",
+        description="Depth of the voxel grid",
+        default=64.0
+    )
+    voxel_height: bpy.props.FloatProperty(
+        name="Height",
+        description="Height of the voxel grid",
+        default=64.0
+    )
+    voxel_width: bpy.props.FloatProperty(
+        name="Width",
+        description="Width of the voxel grid",
+        default=64.0
+    )
+
+    # Float properties to define the RGB color values for the voxels
+    red_color: bpy.props.FloatProperty(
+        name="R",
+        description="Red color",
+        default=1.0
+    )
+    green_color: bpy.props.FloatProperty(
+        name="G",
+        description="Green color",
+        default=1.0
+    )
+    blue_color: bpy.props.FloatProperty(
+        name="B",
+        description="Blue color",
+        default=1.0
+    )
+
+    # Optional OBJ export of the generated mesh (disabled by default; exporting large meshes is slow)
+    export_obj: bpy.props.BoolProperty(
+        name="Export OBJ",
+        description="Export the generated mesh to an OBJ file after processing",
+        default=False
+    )
+    export_path: bpy.props.StringProperty(
+        name="Export Path",
+        description="Destination of the exported OBJ file",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    # Integer results shown by the panel; written by the count operators and only read in draw().
+    # They are not animatable, so redraws never evaluate keyframes for them.
+    components_6: bpy.props.IntProperty(
+        name="Components 6", description="Connected components (6-connectivity)", default=0, options=set())
+    components_18: bpy.props.IntProperty(
+        name="Components 18", description="Connected components (18-connectivity)", default=0, options=set())
+    components_26: bpy.props.IntProperty(
+        name="Components 26", description="Connected components (26-connectivity)", default=0, options=set())
+
+    bubbles_6: bpy.props.IntProperty(
+        name="Bubbles 6", description="Enclosed bubbles (6-connectivity)", default=0, options=set())
+    bubbles_18: bpy.props.IntProperty(
+        name="Bubbles 18", description="Enclosed bubbles (18-connectivity)", default=0, options=set())
+    bubbles_26: bpy.props.IntProperty(
+        name="Bubbles 26", description="Enclosed bubbles (26-connectivity)", default=0, options=set())
+
 class VoxelProcessingPanel(bpy.types.Panel):
     """Creates a Panel in the Object properties"""
     bl_label = "Voxel Processing"
@@ -31,27 +618,33 @@ class VoxelProcessingPanel(bpy.types.Panel):
     def draw(self, context):
         """Draw the UI elements in the panel."""
         layout = self.layout
-        scene = context.scene
+        props = context.scene.voxel
 
         # File path input
-        layout.prop(scene, "voxel_file_path")
+        layout.prop(props, "voxel_file_path")
 
         # Section for resolution
         layout.label(text="Resolution Settings")
-        layout.prop(scene, "synchronize_dimensions")
+        layout.prop(props, "synchronize_dimensions")
 
-        if scene.synchronize_dimensions:
-            layout.prop(scene, "voxel_uniform_size")
+        if props.synchronize_dimensions:
+            layout.prop(props, "voxel_uniform_size")
         else:
-            layout.prop(scene, "voxel_depth")
-            layout.prop(scene, "voxel_height")
-            layout.prop(scene, "voxel_width")
+            layout.prop(props, "voxel_depth")
+            layout.prop(props, "voxel_height")
+            layout.prop(props, "voxel_width")
 
         # Section for colors
         layout.label(text="Color Settings")
-        layout.prop(scene, "red_color")
-        layout.prop(scene, "green_color")
-        layout.prop(scene, "blue_color")
+        layout.prop(props, "red_color")
+        layout.prop(props, "green_color")
+        layout.prop(props, "blue_color")
+
+        # Section for OBJ export
+        layout.label(text="Export Settings")
+        layout.prop(props, "export_obj")
+        if props.export_obj:
+            layout.prop(props, "export_path")
 
         # Button to execute the processing
         layout.operator("object.process_voxel_data")
@@ -68,214 +661,117 @@ class VoxelProcessingPanel(bpy.types.Panel):
         layout.operator("object.count_bubbles_6", text="6-Connectivity")
         layout.operator("object.count_bubbles_18", text="18-Connectivity")
         layout.operator("object.count_bubbles_26", text="26-Connectivity")
+        layout.operator("object.count_bubbles_all", text="All Connectivities")
 
         # Display connected components results
         layout.label(text="Connected Components Count:")
-        layout.label(text=f"6-Connectivity: {scene.components_6}")
-        layout.label(text=f"18-Connectivity: {scene.components_18}")
-        layout.label(text=f"26-Connectivity: {scene.components_26}")
+        layout.label(text=f"6-Connectivity: {props.components_6}")
+        layout.label(text=f"18-Connectivity: {props.components_18}")
+        layout.label(text=f"26-Connectivity: {props.components_26}")
 
         # Display bubbles results
         layout.label(text="Bubbles Count:")
-        layout.label(text=f"6-Bubbles: {scene.bubbles_6}")
-        layout.label(text=f"18-Bubbles: {scene.bubbles_18}")
-        layout.label(text=f"26-Bubbles: {scene.bubbles_26}")
+        layout.label(text=f"6-Bubbles: {props.bubbles_6}")
+        layout.label(text=f"18-Bubbles: {props.bubbles_18}")
+        layout.label(text=f"26-Bubbles: {props.bubbles_26}")
 
-class ProcessVoxelDataOperator(bpy.types.Operator):
-    """Optimized version with three loops for better performance in Blender."""
-    bl_idname = "object.process_voxel_data"  # Unique identifier for this operator in Blender
-    bl_label = "Process Voxel Data"  # Display name in Blender's UI
+def _geometry_worker(compute, filepath, shape, results):
+    """
+    Worker thread body: hand the geometry (or the raised exception) back through the queue.
 
-    def execute(self, context):
+    Parameters:
+        compute (callable): compute_geometry of the operator class, called as compute(filepath, shape)
+        filepath (str): Path to the voxel data file
+        shape (tuple): Grid dimensions (depth, height, width)
+        results (Queue): Receives (True, (vertices, faces)) or (False, exception)
+    """
+    try:
+        results.put((True, compute(filepath, shape)))
+    except Exception as e:
+        results.put((False, e))
+
+class BaseProcessVoxelDataOperator(bpy.types.Operator):
+    """
+    Base operator that turns voxel data into a mesh object in the Blender scene.
+
+    When started from the UI (invoke), the NumPy work of build_geometry runs on a worker thread
+    while a modal timer keeps Blender responsive; ESC cancels the run, and both process operators
+    stay disabled until it finishes or is cancelled. The mesh, material, camera
+    and optional OBJ export are created on the main thread, since Blender's data API is not
+    thread-safe. Running the operator from a script (execute) does everything synchronously.
+    """
+    _timer = None    # Modal event timer polling the worker
+    _results = None  # Queue receiving (success, payload) from the worker thread
+
+    @classmethod
+    def poll(cls, context):
+        """Disable both process operators while a background mesh job is running."""
+        return not _PROCESS_JOB_RUNNING
+
+    @staticmethod
+    def build_geometry(data):
         """
-        Main execution method for processing voxel data into a 3D mesh in Blender.
+        Build the mesh geometry for a voxel grid. Implemented by subclasses.
 
         Parameters:
-            context: Blender context object providing access to scene properties
+            data (np.ndarray): Rotated 3D voxel array (1 = occupied)
 
         Returns:
-            dict: Operator status ('FINISHED' for success, 'CANCELLED' for failure)
+            tuple: (vertices, faces) as an (N, 3) coordinate array and an (F, 4) quad index array
         """
-        # Record the start time to measure execution duration
-        start_time = time.time()
+        raise NotImplementedError
 
-        # Retrieve file path and dimensions from Blender scene properties
-        filepath = context.scene.voxel_file_path  # Path to the voxel data file
-        if context.scene.synchronize_dimensions:
+    def read_settings(self, context):
+        """Read the file path, grid shape and material color from the scene (None if invalid)."""
+        props = context.scene.voxel
+        filepath = props.voxel_file_path  # Path to the voxel data file
+        if props.synchronize_dimensions:
             # If dimensions are synchronized, use a uniform size for depth, height, width
-            height = width = depth = int(context.scene.voxel_uniform_size)
+            height = width = depth = int(props.voxel_uniform_size)
         else:
             # Otherwise, use individual dimensions from scene properties
-            depth = int(context.scene.voxel_depth)    # Number of voxels along depth (x-axis)
-            height = int(context.scene.voxel_height)  # Number of voxels along height (y-axis)
-            width = int(context.scene.voxel_width)    # Number of voxels along width (z-axis)
+            depth = int(props.voxel_depth)    # Number of voxels along depth (x-axis)
+            height = int(props.voxel_height)  # Number of voxels along height (y-axis)
+            width = int(props.voxel_width)    # Number of voxels along width (z-axis)
 
-        # Get RGB color values from scene properties (assumed to be in 0-255 range)
-        red_color = int(context.scene.red_color)    # Red component of material color
-        green_color = int(context.scene.green_color)  # Green component
-        blue_color = int(context.scene.blue_color)    # Blue component
+        # RGBA material color from scene properties
+        color = (int(props.red_color), int(props.green_color), int(props.blue_color), 1.0)
 
         # Validate file path; cancel if not provided
         if not filepath:
             self.report({'ERROR'}, "No file path provided.")  # Report error to Blender UI
-            return {'CANCELLED'}  # Exit operator with failure status
+            return None
+        return filepath, (depth, height, width), color
 
-        try:
-            # Clear the current Blender scene by selecting and deleting all objects
-            bpy.ops.object.select_all(action="SELECT")  # Select all objects
-            bpy.ops.object.delete()  # Delete selected objects
+    @classmethod
+    def compute_geometry(cls, filepath, shape):
+        """Load, rotate and mesh the voxel data. Touches no Blender data, so it may run on a worker thread."""
+        # Load voxel data and reshape the flat array to a 3D grid
+        data = _load_voxels_cached(filepath, shape)
+        # Rotate 90 degrees counterclockwise in the height-width plane (y-z plane)
+        data = np.rot90(data, k=1, axes=(1, 2))
+        return cls.build_geometry(data)
 
-            # Load voxel data efficiently using NumPy
-            if filepath.endswith('.npy'):
-                data = np.load(filepath)  # Efficient binary format
-            else:
-                with open(filepath, "r") as file:
-                    data = np.loadtxt(file, delimiter=',', dtype=np.uint8)
-
-            # Reshape and rotate the data for correct 3D orientation
-            data = data.reshape((depth, height, width))  # Convert flat array to 3D grid
-            # Rotate 90 degrees counterclockwise in the height-width plane (y-z plane)
-            data = np.rot90(data, k=1, axes=(1, 2))
-
-            # Get the shape of the reshaped data and compute padded dimensions
-            shape = data.shape  # Tuple: (depth, height, width)
-            padded_shape = (shape[0] + 2, shape[1] + 2, shape[2] + 2)  # Add 2 to each dimension for padding
-
-            # Create a zero-padded array to simplify neighbor calculations
-            padded_data = np.zeros(padded_shape, dtype=np.uint8)  # Initialize with zeros
-            # Insert original data into the center of the padded array
-            padded_data[1:-1, 1:-1, 1:-1] = data
-
-            # Compute the sum of 6-connected neighbors using array slicing
-            # Slicing avoids the overhead of np.roll by accessing adjacent layers directly
-            neighbor_sum = (
-                padded_data[:-2, 1:-1, 1:-1] + padded_data[2:, 1:-1, 1:-1] +  # Top and bottom neighbors
-                padded_data[1:-1, :-2, 1:-1] + padded_data[1:-1, 2:, 1:-1] +  # Left and right neighbors
-                padded_data[1:-1, 1:-1, :-2] + padded_data[1:-1, 1:-1, 2:]    # Front and back neighbors
-            )
-
-            # Identify surface voxels: occupied (1) with fewer than 6 occupied neighbors
-            surface_voxels = (data == 1) & (neighbor_sum < 6)
-
-            # Initialize data structures for mesh construction
-            vertices = []  # List to store unique vertex coordinates (x, y, z)
-            faces = []     # List to store face definitions (quads as vertex index tuples)
-            vertex_map = {}  # Dictionary to map vertex coordinates to indices
-            face_count = {}  # Dictionary to track face occurrences for deduplication
-            cube_size = 1.0  # Size of each voxel cube in Blender units
-            
-            '''# Get surface voxel indices
-            surface_indices = np.where(surface_voxels)
-            surface_i, surface_j, surface_k = surface_indices
-
-            # Process only surface voxels
-            for i, j, k in zip(surface_i, surface_j, surface_k):'''
-              
-            # Process each voxel in the 3D grid using three nested loops
-            for i in range(surface_voxels.shape[0]):  # Loop over depth (x)
-                for j in range(surface_voxels.shape[1]):  # Loop over height (y)
-                    for k in range(surface_voxels.shape[2]):  # Loop over width (z)
-                        if surface_voxels[i, j, k]:  # If this is a surface voxel
-                            # Determine face orientation based on parity of coordinates
-                            is_clockwise = (i + j + k) % 2 == 0  # True for clockwise, False for counterclockwise
-
-                            # Define the 8 vertices of a cube at this voxel position
-                            cube_vertices = [
-                                (i, j, k),                    # Bottom-front-left
-                                (i + cube_size, j, k),        # Bottom-front-right
-                                (i + cube_size, j + cube_size, k),  # Bottom-back-right
-                                (i, j + cube_size, k),        # Bottom-back-left
-                                (i, j, k + cube_size),        # Top-front-left
-                                (i + cube_size, j, k + cube_size),  # Top-front-right
-                                (i + cube_size, j + cube_size, k + cube_size),  # Top-back-right
-                                (i, j + cube_size, k + cube_size)  # Top-back-left
-                            ]
-
-                            # Assign unique indices to vertices, avoiding duplicates
-                            vertex_indices = []
-                            for v in cube_vertices:
-                                if v not in vertex_map:
-                                    # New vertex: assign next index and store coordinates
-                                    vertex_map[v] = len(vertices)
-                                    vertices.append(v)
-                                vertex_indices.append(vertex_map[v])  # Add index to current cube
-
-                            # Define the 6 faces of the cube (quadrilaterals)
-                            if is_clockwise:
-                                cube_faces = [
-                                    (vertex_indices[0], vertex_indices[1], vertex_indices[2], vertex_indices[3]),  # Base
-                                    (vertex_indices[4], vertex_indices[5], vertex_indices[6], vertex_indices[7]),  # Top
-                                    (vertex_indices[0], vertex_indices[1], vertex_indices[5], vertex_indices[4]),  # Front
-                                    (vertex_indices[1], vertex_indices[2], vertex_indices[6], vertex_indices[5]),  # Right
-                                    (vertex_indices[2], vertex_indices[3], vertex_indices[7], vertex_indices[6]),  # Back
-                                    (vertex_indices[3], vertex_indices[0], vertex_indices[4], vertex_indices[7]),  # Left
-                                ]
-                            else:
-                                # Reverse order for counterclockwise orientation
-                                cube_faces = [
-                                    (vertex_indices[1], vertex_indices[0], vertex_indices[3], vertex_indices[2]),  # Base
-                                    (vertex_indices[5], vertex_indices[4], vertex_indices[7], vertex_indices[6]),  # Top
-                                    (vertex_indices[1], vertex_indices[0], vertex_indices[4], vertex_indices[5]),  # Front
-                                    (vertex_indices[2], vertex_indices[1], vertex_indices[5], vertex_indices[6]),  # Right
-                                    (vertex_indices[3], vertex_indices[2], vertex_indices[6], vertex_indices[7]),  # Back
-                                    (vertex_indices[0], vertex_indices[3], vertex_indices[7], vertex_indices[4]),  # Left
-                                ]
-
-                            # Track face occurrences to identify internal vs. external faces
-                            for face in cube_faces:
-                                if face in face_count:
-                                    face_count[face] += 1  # Increment count if face already exists
-                                else:
-                                    face_count[face] = 1  # Initialize count for new face
-
-            # Filter out internal faces (those appearing more than once)
-            faces_list = [face for face, count in face_count.items() if count == 1]
-
-            # Create a new Blender mesh from the processed data
-            mesh = bpy.data.meshes.new("PerimeterCubesMesh")  # Create mesh object
-            mesh.from_pydata(vertices, [], faces_list)  # Populate with vertices and faces (no edges)
-            obj = bpy.data.objects.new("PerimeterCubes", mesh)  # Create object from mesh
-            bpy.context.collection.objects.link(obj)  # Add object to current scene collection
-
-            # Calculate and report execution time
-            execution_time = time.time() - start_time
-            self.report({'INFO'}, f"Execution time: {execution_time:.4f} seconds")  # Display in Blender UI
-
-            # Apply a material with the specified color to the object
-            color_material = bpy.data.materials.new(name="ColorMaterial")  # Create new material
-            # Set diffuse color (normalized to 0-1 range assumed; adjust if input is 0-255)
-            color_material.diffuse_color = (red_color, green_color, blue_color, 1.0)
-            obj.data.materials.append(color_material)  # Assign material to object
-
-            # Add a camera
-            camera_data = bpy.data.cameras.new("Camera")
-            camera_object = bpy.data.objects.new("Camera", camera_data)
-            bpy.context.collection.objects.link(camera_object)
-            camera_object.location = (300, -100, 200)
-            obj_center = obj.location
-            camera_object.rotation_mode = 'XYZ'
-            camera_direction = obj_center - camera_object.location
-            camera_object.rotation_euler = camera_direction.to_track_quat('-Z', 'Y').to_euler()
-            bpy.context.scene.camera = camera_object
-
-            # Export the mesh to an OBJ file
-            output_path = r"C:\Users\Slaye\OneDrive\Escritorio\Test.obj"  # Hardcoded export path
-            bpy.ops.wm.obj_export(filepath=output_path)  # Export operation
-            
-            # Obtener el tamaño del archivo .obj
-            if os.path.exists(output_path):  # Verificar que el archivo existe antes de medir su tamaño
-                obj_size_bytes = os.path.getsize(output_path)
-                obj_size_kb = obj_size_bytes / 1024  # Convertir a KB
-                obj_size_mb = obj_size_kb / 1024  # Convertir a MB
-
-                # Reportar el tamaño del archivo .obj en Blender
-                self.report({'INFO'}, f"Tamaño del archivo .obj: {obj_size_bytes} bytes ({obj_size_kb:.2f} KB / {obj_size_mb:.2f} MB)")
-            else:
-                self.report({'ERROR'}, "Error: El archivo .obj no se generó correctamente.")
-                
-            # Report successful completion
-            self.report({'INFO'}, "Voxel data processed and object created successfully!")
+    def execute(self, context):
+        """
+        Process the voxel data synchronously and create the mesh object.
 
+        Parameters:
+            context: Blender context object providing access to scene properties
+
+        Returns:
+            dict: Operator status ('FINISHED' for success, 'CANCELLED' for failure)
+        """
+        settings = self.read_settings(context)
+        if settings is None:
+            return {'CANCELLED'}
+        filepath, shape, color = settings
+
+        # Record the start time to measure execution duration
+        start_time = time.time()
+        try:
+            vertices, faces = self.compute_geometry(filepath, shape)
+            self.create_object(context, vertices, faces, color, start_time)
         except Exception as e:
             # Handle any errors during execution (e.g., file not found, invalid data)
             self.report({'ERROR'}, f"Failed to process file: {e}")
@@ -283,177 +779,255 @@ class ProcessVoxelDataOperator(bpy.types.Operator):
 
         return {'FINISHED'}  # Successful completion status
 
+    def invoke(self, context, event):
+        """Start the geometry computation on a worker thread and poll it from a modal timer."""
+        settings = self.read_settings(context)
+        if settings is None:
+            return {'CANCELLED'}
+        filepath, shape, self._color = settings
+
+        global _PROCESS_JOB_RUNNING
+        _PROCESS_JOB_RUNNING = True  # Cleared by _remove_timer when the modal handler exits
+
+        self._start_time = time.time()
+        # The thread gets the class method and its own queue, never the operator itself:
+        # Blender frees the operator on cancel while the worker may still be running
+        results = Queue()
+        self._results = results
+        worker = threading.Thread(target=_geometry_worker,
+                                  args=(type(self).compute_geometry, filepath, shape, results), daemon=True)
+        worker.start()
+
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(0.1, window=context.window)
+        window_manager.modal_handler_add(self)
+        self.report({'INFO'}, "Processing voxel data... (ESC to cancel)")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        """Wait for the worker, then build the Blender objects on the main thread."""
+        if event.type == 'ESC' and event.value == 'PRESS':
+            # The worker cannot be interrupted; its result is discarded when it finishes
+            self._remove_timer(context)
+            self.report({'WARNING'}, "Voxel processing cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER' or self._results.empty():
+            return {'PASS_THROUGH'}
 
-class ProcessVoxelDataOperatorComplete(bpy.types.Operator):
+        self._remove_timer(context)
+        success, payload = self._results.get()
+        if not success:
+            self.report({'ERROR'}, f"Failed to process file: {payload}")
+            return {'CANCELLED'}
+
+        try:
+            vertices, faces = payload
+            self.create_object(context, vertices, faces, self._color, self._start_time)
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to process file: {e}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def _remove_timer(self, context):
+        """Stop the modal polling timer and re-enable the process operators."""
+        global _PROCESS_JOB_RUNNING
+        _PROCESS_JOB_RUNNING = False
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+    def create_object(self, context, vertices, faces, color, start_time):
+        """
+        Create the mesh object with its material and camera, and export it if requested.
+
+        Parameters:
+            context: Blender context object providing access to scene properties
+            vertices (np.ndarray): (N, 3) vertex coordinates
+            faces (np.ndarray): (F, 4) vertex indices of each quad
+            color (tuple): RGBA diffuse color of the material
+            start_time (float): time.time() at the start of processing, for the timing report
+        """
+        scene = context.scene
+
+        # Remove the objects created by a previous run (other objects are kept)
+        _remove_generated_objects()
+
+        # Create a new Blender mesh from the processed data
+        mesh = _create_quad_mesh("PerimeterCubesMesh", vertices, faces)  # Bulk upload of vertices and quads
+        obj = bpy.data.objects.new("PerimeterCubes", mesh)  # Create object from mesh
+        context.collection.objects.link(obj)  # Add object to current scene collection
+
+        # Seleccionar el objeto recién creado
+        for selected in context.selected_objects:  # Deseleccionar todo
+            selected.select_set(False)
+        obj.select_set(True)  # Seleccionar el objeto
+        context.view_layer.objects.active = obj  # Establecer como objeto activo
+
+        # Calculate and report execution time
+        execution_time = time.time() - start_time
+        self.report({'INFO'}, f"Execution time: {execution_time:.4f} seconds")  # Display in Blender UI
+
+        # Apply a material with the specified color to the object
+        color_material = bpy.data.materials.new(name="ColorMaterial")  # Create new material
+        # Set diffuse color (normalized to 0-1 range assumed; adjust if input is 0-255)
+        color_material.diffuse_color = color
+        obj.data.materials.append(color_material)  # Assign material to object
+
+        # Add a camera
+        camera_data = bpy.data.cameras.new("Camera")
+        camera_object = bpy.data.objects.new("Camera", camera_data)
+        context.collection.objects.link(camera_object)
+        camera_object.location = (300, -100, 200)
+        obj_center = obj.location
+        camera_object.rotation_mode = 'XYZ'
+        camera_direction = obj_center - camera_object.location
+        camera_object.rotation_euler = camera_direction.to_track_quat('-Z', 'Y').to_euler()
+        scene.camera = camera_object
+
+        # Export the mesh to an OBJ file only when requested; serializing large meshes is slow
+        props = scene.voxel
+        if props.export_obj:
+            output_path = bpy.path.abspath(props.export_path)
+            if not output_path:
+                self.report({'WARNING'}, "OBJ export is enabled but no export path was provided.")
+            else:
+                # Only the generated mesh is selected; other scene objects are left out of the file
+                bpy.ops.wm.obj_export(filepath=output_path, export_selected_objects=True)  # Export operation
+
+                # Obtener el tamaño del archivo .obj
+                if os.path.exists(output_path):  # Verificar que el archivo existe antes de medir su tamaño
+                    obj_size_bytes = os.path.getsize(output_path)
+                    obj_size_kb = obj_size_bytes / 1024  # Convertir a KB
+                    obj_size_mb = obj_size_kb / 1024  # Convertir a MB
+
+                    # Reportar el tamaño del archivo .obj en Blender
+                    self.report({'INFO'}, f"Tamaño del archivo .obj: {obj_size_bytes} bytes ({obj_size_kb:.2f} KB / {obj_size_mb:.2f} MB)")
+                else:
+                    self.report({'ERROR'}, "Error: El archivo .obj no se generó correctamente.")
+
+        # Report successful completion
+        self.report({'INFO'}, "Voxel data processed and object created successfully!")
+
+
+class ProcessVoxelDataOperator(BaseProcessVoxelDataOperator):
+    """Builds a shell mesh from the exposed faces of the occupied voxels."""
+    bl_idname = "object.process_voxel_data"  # Unique identifier for this operator in Blender
+    bl_label = "Process Voxel Data"  # Display name in Blender's UI
+
+    @staticmethod
+    def build_geometry(data):
+        """
+        Build the external shell of the occupied voxels, sharing vertices between faces.
+
+        Parameters:
+            data (np.ndarray): Rotated 3D voxel array (1 = occupied)
+
+        Returns:
+            tuple: (vertices, faces) as an (N, 3) int32 array and an (F, 4) quad index array
+        """
+        # A face is external iff the neighbor in that direction is empty, so emit only those quads.
+        # Corner coordinates are kept as separate contiguous x/y/z int32 arrays.
+        corner_x, corner_y, corner_z = [], [], []
+        for direction, exposed in enumerate(_exposed_face_masks(data)):
+            xs, ys, zs = (axis.astype(np.int32) for axis in np.nonzero(exposed))
+            corners = FACE_CORNERS[direction]  # (4, 3) corner offsets of this face
+            corner_x.append((xs[:, None] + corners[:, 0]).ravel())
+            corner_y.append((ys[:, None] + corners[:, 1]).ravel())
+            corner_z.append((zs[:, None] + corners[:, 2]).ravel())
+        xs = np.concatenate(corner_x)
+        ys = np.concatenate(corner_y)
+        zs = np.concatenate(corner_z)
+
+        # Merge corners shared between quads into unique vertices
+        return _index_quad_corners(xs, ys, zs)
+
+
+class ProcessVoxelDataOperatorComplete(BaseProcessVoxelDataOperator):
     """
     Reads and processes voxel data from a file, creates a 3D representation of the perimeter voxels,
-    and adds it to the Blender scene. The operator clears the current scene, processes the voxel data,
-    generates 3D geometry for perimeter voxels, and sets up a camera and material for the created object.
+    and adds it to the Blender scene. The operator removes the objects of a previous run, processes the
+    voxel data, generates 3D geometry for perimeter voxels, and sets up a camera and material for the
+    created object.
 
     Attributes:
-        bl_idnameC (str): Unique identifier for the operator.
-        bl_labelC (str): Display label for the operator in the Blender UI.
+        bl_idname (str): Unique identifier for the operator.
+        bl_label (str): Display label for the operator in the Blender UI.
 
     Methods:
-        execute(context):
-            Main execution method for the operator. Reads voxel data, processes it, generates a 3D model,
-            applies material and color, and sets up a camera. Returns operation status.
+        build_geometry(data):
+            Generates a cube for every perimeter voxel (all 6 faces), sharing vertices and walls
+            between touching cubes. The loading, threading, material and camera setup are
+            inherited from BaseProcessVoxelDataOperator.
     """
     
     bl_idname = "object.process_voxel_data_complete"
     bl_label = "Process Voxel Data Complete"
     
-    def execute(self, context):
-        # Get the file path and dimensions from the scene
-        
-        start_time = time.time()  # Record the start time
-        
-        filepath = context.scene.voxel_file_path
-        
-        # Check if dimensions are synchronized
-        if context.scene.synchronize_dimensions:
-            height = width = depth = int(context.scene.voxel_uniform_size)
-        else:
-            depth = int(context.scene.voxel_depth)
-            height = int(context.scene.voxel_height)
-            width = int(context.scene.voxel_width)
+    @staticmethod
+    def build_geometry(data):
+        """
+        Build a cube for every perimeter voxel.
+
+        Parameters:
+            data (np.ndarray): Rotated 3D voxel array (1 = occupied)
+
+        Returns:
+            tuple: (vertices, faces) as an (N, 3) int32 array and an (F, 4) int32 quad index array
+        """
+        # Occupancy mask, computed once and reused for the padding and the perimeter test
+        occupied = data == 1
+
+        # Zero-padded copy of the data so every voxel has 6 neighbors
+        padded_shape = (data.shape[0] + 2, data.shape[1] + 2, data.shape[2] + 2)
+        padded_data = np.zeros(padded_shape, dtype=np.uint8)
+        padded_data[1:-1, 1:-1, 1:-1] = occupied  # Occupancy as 0/1, so the sum fits in uint8
         
-        Red_color = int(context.scene.red_color)
-        Green_color = int(context.scene.green_color)
-        Blue_color = int(context.scene.blue_color)
-            
-        # Ensure a file path is provided
-        if not filepath:
-            self.report({'ERROR'}, "No file path provided.")
-            return {'CANCELLED'}
+        # Sum the 6-connected neighbors by slicing adjacent layers (no np.roll copies),
+        # accumulating in place into one uint8 buffer instead of allocating a temporary per add
+        neighbor_sum = np.zeros(data.shape, dtype=np.uint8)
+        for neighbor in (
+            padded_data[:-2, 1:-1, 1:-1], padded_data[2:, 1:-1, 1:-1],  # Top and bottom neighbors
+            padded_data[1:-1, :-2, 1:-1], padded_data[1:-1, 2:, 1:-1],  # Left and right neighbors
+            padded_data[1:-1, 1:-1, :-2], padded_data[1:-1, 1:-1, 2:],  # Front and back neighbors
+        ):
+            np.add(neighbor_sum, neighbor, out=neighbor_sum)
         
-        try:
-            # Clear the scene
-            bpy.ops.object.select_all(action="SELECT")
-            bpy.ops.object.delete()
-
-            # Open and read the file
-            with open(filepath, "r") as file:
-                data = np.loadtxt(file, delimiter=',')
-            
-            # Reshape and process the data
-            data = data.reshape(depth, height, width)
-            data = np.rot90(data, k=1, axes=(1, 2))
-            
-            # Define the size of each cube (voxel) in the 3D model
-            Cube_size = 1.0  # You can adjust this value as needed
-
-            padded_data = np.pad(data, 1, mode='constant')
-            
-            neighbor_sum = (
-                np.roll(padded_data, 1, axis=0) + np.roll(padded_data, -1, axis=0)
-                + np.roll(padded_data, 1, axis=1) + np.roll(padded_data, -1, axis=1)
-                + np.roll(padded_data, 1, axis=2) + np.roll(padded_data, -1, axis=2)
-            )
-            
-            perimeter_voxels = (data == 1) & (neighbor_sum[1:-1, 1:-1, 1:-1] < 6)
-            
-            # Create the 3D geometry
-            vertices, edges, faces = [], [], []
-            
-            for i in range(perimeter_voxels.shape[0]):
-                for j in range(perimeter_voxels.shape[1]):
-                    for k in range(perimeter_voxels.shape[2]):
-                        if perimeter_voxels[i, j, k]:
-                          
-                            cube_vertices = [
-                                (i, j, k), (i + Cube_size, j, k), (i + Cube_size, j + Cube_size, k), (i, j + Cube_size, k),
-                                (i, j, k + Cube_size), (i + Cube_size, j, k + Cube_size), (i + Cube_size, j + Cube_size, k + Cube_size), (i, j + Cube_size, k + Cube_size)
-                            ]
-                            
-                            vertices.extend(cube_vertices)
-                            start_index = len(vertices) - 8
-                            
-                            faces.extend([
-                                (start_index, start_index + 1, start_index + 2, start_index + 3),
-                                (start_index + 4, start_index + 5, start_index + 6, start_index + 7),
-                                (start_index, start_index + 1, start_index + 5, start_index + 4),
-                                (start_index + 1, start_index + 2, start_index + 6, start_index + 5),
-                                (start_index + 2, start_index + 3, start_index + 7, start_index + 6),
-                                (start_index + 3, start_index, start_index + 4, start_index + 7)
-                            ])
-            
-            # Create the mesh and object
-            mesh = bpy.data.meshes.new("PerimeterCubesMesh")
-            mesh.from_pydata(vertices, edges, faces)
-            obj = bpy.data.objects.new("PerimeterCubes", mesh)
-            bpy.context.collection.objects.link(obj)
-            
-            # Seleccionar el objeto recién creado
-            bpy.ops.object.select_all(action='DESELECT')  # Deseleccionar todo
-            obj.select_set(True)  # Seleccionar el objeto
-            bpy.context.view_layer.objects.active = obj  # Establecer como objeto activo
-            
-            # Add a color material
-            Color_material = bpy.data.materials.new(name="ColorMaterial")
-            Color_material.diffuse_color = (Red_color, Green_color, Blue_color, 1.0)  # RGBA: Red with full opacity
-            obj.data.materials.append(Color_material)
-            
-            end_time = time.time()  # Record the end time
-            execution_time = end_time - start_time  # Calculate the total execution time
-
-            # Display the execution time in Blender's interface
-            self.report({'INFO'}, f"Execution time: {execution_time:.4f} seconds")
+        perimeter_voxels = occupied & (neighbor_sum < 6)
         
-            # Add a camera
-            camera_data = bpy.data.cameras.new("Camera")
-            camera_object = bpy.data.objects.new("Camera", camera_data)
-            bpy.context.collection.objects.link(camera_object)
-            camera_object.location = (300, -100, 200)
-            obj_center = obj.location
-            camera_object.rotation_mode = 'XYZ'
-            camera_direction = obj_center - camera_object.location
-            camera_object.rotation_euler = camera_direction.to_track_quat('-Z', 'Y').to_euler()
-            bpy.context.scene.camera = camera_object
-            
-            # Exportar el objeto a un archivo .obj
-            output_path = r"C:\Users\Slaye\OneDrive\Escritorio\Test_1.obj"  # Cambia esto por la ruta deseada
-            bpy.ops.wm.obj_export(filepath=output_path)
-            
-            # Obtener el tamaño del archivo .obj
-            if os.path.exists(output_path):  # Verificar que el archivo existe antes de medir su tamaño
-                obj_size_bytes = os.path.getsize(output_path)
-                obj_size_kb = obj_size_bytes / 1024  # Convertir a KB
-                obj_size_mb = obj_size_kb / 1024  # Convertir a MB
-
-                # Reportar el tamaño del archivo .obj en Blender
-                self.report({'INFO'}, f"Tamaño del archivo .obj: {obj_size_bytes} bytes ({obj_size_kb:.2f} KB / {obj_size_mb:.2f} MB)")
-            else:
-                self.report({'ERROR'}, "Error: El archivo .obj no se generó correctamente.")
-                
-            # Success message
-            self.report({'INFO'}, "Voxel data processed and object created successfully!")
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to process file: {e}")
-            return {'CANCELLED'}
-    
-        return {'FINISHED'}
+        # Create the 3D geometry: all 6 outward-facing quads of every perimeter voxel cube
+        px, py, pz = (axis.astype(np.int32) for axis in np.nonzero(perimeter_voxels))
+        xs = (px[:, None, None] + FACE_CORNERS[None, :, :, 0]).ravel()
+        ys = (py[:, None, None] + FACE_CORNERS[None, :, :, 1]).ravel()
+        zs = (pz[:, None, None] + FACE_CORNERS[None, :, :, 2]).ravel()
+
+        # Share corners between neighboring cubes instead of emitting 8 vertices per cube
+        vertices, faces = _index_quad_corners(xs, ys, zs)
+
+        # Touching cubes now emit their shared wall twice over the same 4 vertices; keep one copy.
+        # Each face's sorted vertex indices are viewed as a single structured record so the
+        # duplicate search is one C-level sort instead of hashing tuples.
+        face_dt = np.dtype([('a', '<i4'), ('b', '<i4'), ('c', '<i4'), ('d', '<i4')])
+        face_records = np.ascontiguousarray(np.sort(faces, axis=1)).view(face_dt).reshape(-1)
+        _, first_index = np.unique(face_records, return_index=True)
+        faces = faces[np.sort(first_index)]  # Original winding and order of the kept faces
+        return vertices, faces
       
 class BaseCountConnectedComponentsOperator(bpy.types.Operator):
     """Base operator for counting connected components in voxel data."""
-    # Precomputed neighbor lists as class attributes
-    NEIGHBORS_6 = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
-    NEIGHBORS_18 = [(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
-                    if (x, y, z) != (0, 0, 0) and abs(x) + abs(y) + abs(z) <= 2]
-    NEIGHBORS_26 = [(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
-                    if (x, y, z) != (0, 0, 0)]
 
     def get_voxel_data(self, context):
         """Read and reshape voxel data from the file based on scene properties."""
-        filepath = context.scene.voxel_file_path
+        props = context.scene.voxel
+        filepath = props.voxel_file_path
 
         # Determine dimensions from scene properties
-        if context.scene.synchronize_dimensions:
-            height = width = depth = int(context.scene.voxel_uniform_size)
+        if props.synchronize_dimensions:
+            height = width = depth = int(props.voxel_uniform_size)
         else:
-            depth = int(context.scene.voxel_depth)
-            height = int(context.scene.voxel_height)
-            width = int(context.scene.voxel_width)
+            depth = int(props.voxel_depth)
+            height = int(props.voxel_height)
+            width = int(props.voxel_width)
 
         # Validate file path
         if not filepath:
@@ -461,9 +1035,7 @@ class BaseCountConnectedComponentsOperator(bpy.types.Operator):
             return None
 
         try:
-            with open(filepath, "r") as file:
-                data = np.loadtxt(file, delimiter=',')
-            data = data.reshape(depth, height, width)
+            data = _load_voxels_cached(filepath, (depth, height, width))
             return data
         except Exception as e:
             self.report({'ERROR'}, f"Error processing file: {e}")
@@ -472,45 +1044,17 @@ class BaseCountConnectedComponentsOperator(bpy.types.Operator):
     @staticmethod
     def find_connected_components(data, connectivity):
         """Compute the number of connected components using the specified connectivity."""
-        # Select neighbor list based on connectivity
-        if connectivity == 6:
-            neighbors = BaseCountConnectedComponentsOperator.NEIGHBORS_6
-        elif connectivity == 18:
-            neighbors = BaseCountConnectedComponentsOperator.NEIGHBORS_18
-        elif connectivity == 26:
-            neighbors = BaseCountConnectedComponentsOperator.NEIGHBORS_26
-        else:
+        if connectivity not in NEIGHBOR_ARRAYS:
             raise ValueError("Invalid connectivity: must be 6, 18, or 26.")
 
-        # Get dimensions and initialize visited array
-        shape_x, shape_y, shape_z = data.shape
-        total_voxels = shape_x * shape_y * shape_z
-        visited = np.zeros(total_voxels, dtype=bool)
-        components = 0
-
-        def bfs(start_idx):
-            """Perform BFS to explore a connected component."""
-            queue = deque([start_idx])
-            visited[start_idx] = True
-            while queue:
-                current_idx = queue.popleft()
-                cx = current_idx // (shape_y * shape_z)
-                cy = (current_idx % (shape_y * shape_z)) // shape_z
-                cz = current_idx % shape_z
-                for dx, dy, dz in neighbors:
-                    nx, ny, nz = cx + dx, cy + dy, cz + dz
-                    if 0 <= nx < shape_x and 0 <= ny < shape_y and 0 <= nz < shape_z:
-                        neighbor_idx = nx * shape_y * shape_z + ny * shape_z + nz
-                        if data[nx, ny, nz] == 1 and not visited[neighbor_idx]:
-                            visited[neighbor_idx] = True
-                            queue.append(neighbor_idx)
-
-        # Iterate over all voxels to find components
-        for idx in range(total_voxels):
-            if data.flat[idx] == 1 and not visited[idx]:
-                components += 1
-                bfs(idx)
-
+        if ndimage is not None:
+            # Label the occupied voxels in compiled code; only the component count is needed
+            labels = _scratch_buffer('labels', data.shape, np.int32)
+            components = ndimage.label(data == 1, structure=STRUCTURES[connectivity], output=labels)
+        else:
+            # Fall back to the Numba union-find count (shared with the bubble count) when SciPy
+            # is not installed; the False border of the padded mask replaces the bounds checks
+            components = _count_components_padded(_padded_mask(data, 1), connectivity, exclude_boundary=False)
         return components
 
 class CountConnectedComponents6Operator(BaseCountConnectedComponentsOperator):
@@ -528,7 +1072,7 @@ class CountConnectedComponents6Operator(BaseCountConnectedComponentsOperator):
         components = BaseCountConnectedComponentsOperator.find_connected_components(data, 6)
         exec_time = time.time() - start_time
 
-        context.scene.components_6 = components
+        context.scene.voxel.components_6 = components
         self.report({'INFO'}, f"Connected components (6-connectivity): {components}, "
                               f"Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
@@ -548,7 +1092,7 @@ class CountConnectedComponents18Operator(BaseCountConnectedComponentsOperator):
         components = BaseCountConnectedComponentsOperator.find_connected_components(data, 18)
         exec_time = time.time() - start_time
 
-        context.scene.components_18 = components
+        context.scene.voxel.components_18 = components
         self.report({'INFO'}, f"Connected components (18-connectivity): {components}, "
                               f"Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
@@ -568,31 +1112,26 @@ class CountConnectedComponents26Operator(BaseCountConnectedComponentsOperator):
         components = BaseCountConnectedComponentsOperator.find_connected_components(data, 26)
         exec_time = time.time() - start_time
 
-        context.scene.components_26 = components
+        context.scene.voxel.components_26 = components
         self.report({'INFO'}, f"Connected components (26-connectivity): {components}, "
                               f"Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
       
 class BaseCountBubblesOperator(bpy.types.Operator):
     """Base operator for counting bubbles in voxel data."""
-    # Precomputed neighbor lists as class attributes
-    NEIGHBORS_6 = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
-    NEIGHBORS_18 = [(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
-                    if (x, y, z) != (0, 0, 0) and abs(x) + abs(y) + abs(z) <= 2]
-    NEIGHBORS_26 = [(x, y, z) for x in [-1, 0, 1] for y in [-1, 0, 1] for z in [-1, 0, 1]
-                    if (x, y, z) != (0, 0, 0)]
 
     def get_voxel_data(self, context):
         """Read and reshape voxel data from the file based on scene properties."""
-        filepath = context.scene.voxel_file_path
+        props = context.scene.voxel
+        filepath = props.voxel_file_path
 
         # Determine dimensions from scene properties
-        if context.scene.synchronize_dimensions:
-            height = width = depth = int(context.scene.voxel_uniform_size)
+        if props.synchronize_dimensions:
+            height = width = depth = int(props.voxel_uniform_size)
         else:
-            depth = int(context.scene.voxel_depth)
-            height = int(context.scene.voxel_height)
-            width = int(context.scene.voxel_width)
+            depth = int(props.voxel_depth)
+            height = int(props.voxel_height)
+            width = int(props.voxel_width)
 
         # Validate file path
         if not filepath:
@@ -600,14 +1139,42 @@ class BaseCountBubblesOperator(bpy.types.Operator):
             return None
 
         try:
-            with open(filepath, "r") as file:
-                data = np.loadtxt(file, delimiter=',')
-            data = data.reshape(depth, height, width)
+            data = _load_voxels_cached(filepath, (depth, height, width))
             return data
         except Exception as e:
             self.report({'ERROR'}, f"Error processing file: {e}")
             return None
 
+    def count_bubbles(self, context, data, connectivities):
+        """
+        Return the bubble counts for the given connectivities, reusing earlier results while the
+        file is unchanged on disk and the grid dimensions are the same.
+
+        Parameters:
+            context: Blender context object providing access to scene properties
+            data (np.ndarray): Voxel grid loaded from the scene's file by get_voxel_data
+            connectivities (tuple): Connectivities to count (6, 18 and/or 26)
+
+        Returns:
+            tuple: One bubble count per connectivity
+        """
+        filepath = context.scene.voxel.voxel_file_path
+        stamp = (os.path.getmtime(filepath), data.shape)
+        cached = _BUBBLE_CACHE.get(filepath)
+        if cached is None or cached[0] != stamp:
+            # First count for this file, or it changed: start a new entry for the path
+            cached = (stamp, {})
+            _BUBBLE_CACHE[filepath] = cached
+        counts = cached[1]
+
+        missing = [c for c in connectivities if c not in counts]
+        if len(missing) == 3:
+            counts.update(zip((6, 18, 26), BaseCountBubblesOperator.find_bubbles_multi(data)))
+        else:
+            for connectivity in missing:
+                counts[connectivity] = BaseCountBubblesOperator.find_bubbles(data, connectivity)
+        return tuple(counts[c] for c in connectivities)
+
     @staticmethod
     def find_bubbles(data, connectivity):
         """
@@ -620,43 +1187,37 @@ class BaseCountBubblesOperator(bpy.types.Operator):
         Returns:
             int: Number of fully enclosed air pockets (bubbles)
         """
-        # Select neighbor list based on connectivity
-        if connectivity == 6:
-            neighbors = BaseCountBubblesOperator.NEIGHBORS_6
-        elif connectivity == 18:
-            neighbors = BaseCountBubblesOperator.NEIGHBORS_18
-        elif connectivity == 26:
-            neighbors = BaseCountBubblesOperator.NEIGHBORS_26
-        else:
+        if connectivity not in NEIGHBOR_ARRAYS:
             raise ValueError("Invalid connectivity: must be 6, 18, or 26.")
 
-        # Get dimensions
-        shape_x, shape_y, shape_z = data.shape
-        visited = np.zeros_like(data, dtype=bool)
-
-        def bfs(start_x, start_y, start_z):
-            """Performs BFS to explore a connected component of empty voxels."""
-            queue = deque([(start_x, start_y, start_z)])
-            visited[start_x, start_y, start_z] = True
-            is_boundary = False
-            while queue:
-                cx, cy, cz = queue.popleft()
-                for dx, dy, dz in neighbors:
-                    nx, ny, nz = cx + dx, cy + dy, cz + dz
-                    if 0 <= nx < shape_x and 0 <= ny < shape_y and 0 <= nz < shape_z:
-                        if data[nx, ny, nz] == 0 and not visited[nx, ny, nz]:
-                            visited[nx, ny, nz] = True
-                            queue.append((nx, ny, nz))
-                    else:
-                        is_boundary = True
-            return not is_boundary
-
-        bubbles = 0
-        for x, y, z in zip(*np.nonzero(data == 0)):
-            if not visited[x, y, z]:
-                if bfs(x, y, z):
-                    bubbles += 1
-        return max(0, bubbles)
+        if ndimage is not None:
+            return _count_enclosed_labels(data == 0, STRUCTURES[connectivity])
+
+        # Numba union-find fallback when SciPy is not installed
+        # The border of the padded mask counts as occupied, which replaces the kernel's bounds checks
+        return _count_components_padded(_padded_mask(data, 0), connectivity, exclude_boundary=True)
+
+    @staticmethod
+    def find_bubbles_multi(data):
+        """
+        Counts bubbles for 6, 18 and 26-connectivity in one pass over the loaded data.
+
+        The empty-voxel mask (and its padded copy for the Numba fallback) is built once and
+        shared by the three labelings instead of once per connectivity.
+
+        Parameters:
+            data (np.ndarray): 3D array of binary voxel data (0 = empty, 1 = occupied)
+
+        Returns:
+            tuple: (bubbles_6, bubbles_18, bubbles_26)
+        """
+        if ndimage is not None:
+            empty = data == 0
+            return tuple(_count_enclosed_labels(empty, STRUCTURES[c]) for c in (6, 18, 26))
+
+        # Numba union-find fallback when SciPy is not installed
+        empty = _padded_mask(data, 0)
+        return tuple(_count_components_padded(empty, c, exclude_boundary=True) for c in (6, 18, 26))
 
 class CountBubbles6Operator(BaseCountBubblesOperator):
     """Counts bubbles using 6-connectivity."""
@@ -670,10 +1231,11 @@ class CountBubbles6Operator(BaseCountBubblesOperator):
             return {'CANCELLED'}
 
         start_time = time.time()
-        bubbles = BaseCountBubblesOperator.find_bubbles(data, 6)
+        counts = self.count_bubbles(context, data, (6,))
+        bubbles = counts[0]
         exec_time = time.time() - start_time
 
-        context.scene.bubbles_6 = bubbles
+        context.scene.voxel.bubbles_6 = bubbles
         self.report({'INFO'}, f"Bubbles (6-connectivity): {bubbles}, Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
 
@@ -689,10 +1251,11 @@ class CountBubbles18Operator(BaseCountBubblesOperator):
             return {'CANCELLED'}
 
         start_time = time.time()
-        bubbles = BaseCountBubblesOperator.find_bubbles(data, 18)
+        counts = self.count_bubbles(context, data, (18,))
+        bubbles = counts[0]
         exec_time = time.time() - start_time
 
-        context.scene.bubbles_18 = bubbles
+        context.scene.voxel.bubbles_18 = bubbles
         self.report({'INFO'}, f"Bubbles (18-connectivity): {bubbles}, Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
 
@@ -708,95 +1271,44 @@ class CountBubbles26Operator(BaseCountBubblesOperator):
             return {'CANCELLED'}
 
         start_time = time.time()
-        bubbles = BaseCountBubblesOperator.find_bubbles(data, 26)
+        counts = self.count_bubbles(context, data, (26,))
+        bubbles = counts[0]
         exec_time = time.time() - start_time
 
-        context.scene.bubbles_26 = bubbles
+        context.scene.voxel.bubbles_26 = bubbles
         self.report({'INFO'}, f"Bubbles (26-connectivity): {bubbles}, Execution time: {exec_time:.4f} seconds")
         return {'FINISHED'}
+
+class CountAllBubblesOperator(BaseCountBubblesOperator):
+    """Counts bubbles for 6, 18 and 26-connectivity with a single load of the voxel data."""
+    bl_idname = "object.count_bubbles_all"
+    bl_label = "Count Bubbles (All Connectivities)"
+
+    def execute(self, context):
+        """Execute the operator for all three connectivities."""
+        data = self.get_voxel_data(context)
+        if data is None:
+            return {'CANCELLED'}
+
+        start_time = time.time()
+        counts = self.count_bubbles(context, data, (6, 18, 26))
+        bubbles_6, bubbles_18, bubbles_26 = counts
+        exec_time = time.time() - start_time
+
+        props = context.scene.voxel
+        props.bubbles_6 = bubbles_6
+        props.bubbles_18 = bubbles_18
+        props.bubbles_26 = bubbles_26
+        self.report({'INFO'}, f"Bubbles (6/18/26-connectivity): {bubbles_6}/{bubbles_18}/{bubbles_26}, "
+                              f"Execution time: {exec_time:.4f} seconds")
+        return {'FINISHED'}
       
 def register():
-    # Register properties for the scene. These properties allow the user to configure the voxel settings
-    # in the Blender interface.
-
-    # Property to store the file path to the voxel data file
-    bpy.types.Scene.voxel_file_path = bpy.props.StringProperty(
-        name="Voxel File Path",
-        description="Path to the voxel data file",
-        default="",
-        subtype='FILE_PATH'
-    )
-    
-    # Boolean property to indicate if height, width, and depth should be synchronized (same value)
-    bpy.types.Scene.synchronize_dimensions = bpy.props.BoolProperty(
-        name="Synchronize Dimensions",
-        description="Use the same value for height, width, and depth",
-        default=False
-    )
-    
-    # Float property for uniform size of the voxel grid (applied when synchronization is enabled)
-    bpy.types.Scene.voxel_uniform_size = bpy.props.FloatProperty(
-        name="Uniform Size",
-        description="Size for height, width, and depth when synchronized",
-        default=64.0
-    )
-    
-    # Individual properties for the depth, height, and width of the voxel grid
-    bpy.types.Scene.voxel_depth = bpy.props.FloatProperty(
-        name="Depth",
-        description="Depth of the voxel grid",
-        default=64.0
-    )
-    bpy.types.Scene.voxel_height = bpy.props.FloatProperty(
-        name="Height",
-        description="Height of the voxel grid",
-        default=64.0
-    )
-    bpy.types.Scene.voxel_width = bpy.props.FloatProperty(
-        name="Width",
-        description="Width of the voxel grid",
-        default=64.0
-    )
-    
-    # Float properties to define the RGB color values for the voxels
-    bpy.types.Scene.red_color = bpy.props.FloatProperty(
-        name="R",
-        description="Red color",
-        default=1.0
-    )
-    bpy.types.Scene.green_color = bpy.props.FloatProperty(
-        name="G",
-        description="Green color",
-        default=1.0
-    )
-    bpy.types.Scene.blue_color = bpy.props.FloatProperty(
-        name="B",
-        description="Blue color",
-        default=1.0
-    )
-    
-    # Property to store results related to connected components in the voxel data
-    bpy.types.Scene.connectivity_results = bpy.props.StringProperty(
-        name="Connectivity Results",
-        description="Stores results of connected components",
-        default=""
-    )
-    
-    # Property to store results related to bubbles in the voxel data
-    bpy.types.Scene.bubble_results = bpy.props.StringProperty(
-        name="Bubble Results",
-        description="Stores results of Bubbles",
-        default=""
-    )
-    
-    bpy.types.Scene.components_6 = bpy.props.IntProperty(name="Components 6", default=0)
-    bpy.types.Scene.components_18 = bpy.props.IntProperty(name="Components 18", default=0)
-    bpy.types.Scene.components_26 = bpy.props.IntProperty(name="Components 26", default=0)
+    # Register the property group first; the scene gets a single pointer to it. These properties
+    # allow the user to configure the voxel settings in the Blender interface.
+    bpy.utils.register_class(VoxelProps)
+    bpy.types.Scene.voxel = bpy.props.PointerProperty(type=VoxelProps)
 
-    bpy.types.Scene.bubbles_6 = bpy.props.IntProperty(name="Bubbles 6", default=0)
-    bpy.types.Scene.bubbles_18 = bpy.props.IntProperty(name="Bubbles 18", default=0)
-    bpy.types.Scene.bubbles_26 = bpy.props.IntProperty(name="Bubbles 26", default=0)
-    
     # Register the custom classes to make them available in Blender
     bpy.utils.register_class(VoxelProcessingPanel)  # Custom UI panel for voxel processing
     bpy.utils.register_class(ProcessVoxelDataOperator)  # Operator for processing voxel data
@@ -807,6 +1319,7 @@ def register():
     bpy.utils.register_class(CountBubbles6Operator)  # Operator to count bubbles with 6-connectivity
     bpy.utils.register_class(CountBubbles18Operator)  # Operator to count bubbles with 18-connectivity
     bpy.utils.register_class(CountBubbles26Operator)  # Operator to count bubbles with 26-connectivity
+    bpy.utils.register_class(CountAllBubblesOperator)  # Operator to count bubbles with all three connectivities
     
 def unregister():
     # Unregister the custom classes to clean up when the script is disabled
@@ -819,30 +1332,18 @@ def unregister():
     bpy.utils.unregister_class(CountBubbles6Operator)
     bpy.utils.unregister_class(CountBubbles18Operator)
     bpy.utils.unregister_class(CountBubbles26Operator)
+    bpy.utils.unregister_class(CountAllBubblesOperator)
     
-    # Remove the registered properties from the scene to free up resources
-    del bpy.types.Scene.voxel_file_path
-    del bpy.types.Scene.synchronize_dimensions
-    del bpy.types.Scene.voxel_uniform_size
-    
-    del bpy.types.Scene.voxel_depth
-    del bpy.types.Scene.voxel_height
-    del bpy.types.Scene.voxel_width
-    
-    del bpy.types.Scene.red_color
-    del bpy.types.Scene.green_color
-    del bpy.types.Scene.blue_color
-    
-    del bpy.types.Scene.connectivity_results
-    del bpy.types.Scene.bubble_results
-    
-    del bpy.types.Scene.components_6
-    del bpy.types.Scene.components_18
-    del bpy.types.Scene.components_26
-    del bpy.types.Scene.bubbles_6
-    del bpy.types.Scene.bubbles_18
-    del bpy.types.Scene.bubbles_26
-    
+    # Remove the property group from the scene to free up resources
+    del bpy.types.Scene.voxel
+    bpy.utils.unregister_class(VoxelProps)
+
+    # Drop the cached grids (closing their sidecar memory maps), bubble counts and the
+    # volume-sized scratch buffers, so disabling the add-on gives that memory back
+    _VOXEL_CACHE.clear()
+    _BUBBLE_CACHE.clear()
+    _SCRATCH_BUFFERS.clear()
+
 
 # Main entry point: Registers the properties and classes when the script is run
 if __name__ == "__main__":